@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+
+# Directory listings for the import picker, built off the UI thread.
+#
+# A listing is cached with the directory's mtime. Re-opening a folder shows
+# the cached listing straight away and the background scan only re-lists it
+# when the mtime moved (a file was added, removed or renamed). Fresh scans
+# report entries in batches so the picker can fill in progressively.
+
+BATCH_SIZE = 64
+RECENT_LIMIT = 6
+
+
+class DirectoryScanner:
+    def __init__(self, exts=(".txt",), show_hidden=False):
+        self.exts = tuple(ext.lower() for ext in exts)
+        self.show_hidden = show_hidden
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def peek(self, path):
+        """Last known (dirs, files) for path without touching the disk, or None"""
+        with self._lock:
+            entry = self._cache.get(path)
+        return entry[1] if entry else None
+
+    def scan(self, path, on_batch=None, cancelled=None):
+        """Returns (dirs, files, changed); call from a worker thread.
+
+        on_batch(dirs, files) is called with partial results while a
+        directory is actually being listed. If cancelled() turns true the
+        listing stops early, nothing is cached and None is returned.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            entry = self._cache.get(path)
+        if entry and entry[0] == mtime:
+            return entry[1][0], entry[1][1], False
+
+        dirs, files = [], []
+        batch_dirs, batch_files = [], []
+        with os.scandir(path) as it:
+            for item in it:
+                if cancelled and cancelled():
+                    return None
+                if item.name.startswith(".") and not self.show_hidden:
+                    continue
+                try:
+                    is_dir = item.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    batch_dirs.append(item.name)
+                elif item.name.lower().endswith(self.exts):
+                    batch_files.append(item.name)
+                else:
+                    continue
+                if on_batch and len(batch_dirs) + len(batch_files) >= BATCH_SIZE:
+                    on_batch(batch_dirs, batch_files)
+                    dirs += batch_dirs
+                    files += batch_files
+                    batch_dirs, batch_files = [], []
+        if on_batch and (batch_dirs or batch_files):
+            on_batch(batch_dirs, batch_files)
+        dirs = sorted(dirs + batch_dirs, key=str.casefold)
+        files = sorted(files + batch_files, key=str.casefold)
+        with self._lock:
+            self._cache[path] = (mtime, (dirs, files))
+        return dirs, files, True
+
+
+class RecentSources:
+    """Most recently imported files, newest first, kept in a small JSON file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.items = []
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.items = [item for item in json.load(f) if os.path.isfile(item)]
+        except (OSError, ValueError):
+            self.items = []
+        return list(self.items)
+
+    def add(self, filepath):
+        self.items = [filepath] + [item for item in self.items if item != filepath]
+        del self.items[RECENT_LIMIT:]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.items, f)
+        return list(self.items)
@@ -3,6 +3,12 @@ import os
 import random
 import time
 from datetime import datetime
+
+from leaderboard import Leaderboard
+from roster_import import import_roster
+from score_archive import ARCHIVE_NAME, ScoreArchive, ingest_folder
+from storage import CachedRoster, RosterStore
+
 def reset_class(data):
     os.system('clear')
     print("!!! DANGER ZONE !!!")
@@ -12,11 +18,10 @@ def reset_class(data):
     if confirm == 'YES':
         # 1. Clear the dictionary in memory
         data.clear()
+        board.clear()
         
         # 2. Clear the file on the disk
-        # Opening in 'w' mode without writing anything wipes the file
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            pass 
+        save_data(data)
             
         log_action("User reset/wiped all class data")
         print("\nSuccess: Class data has been wiped.")
@@ -29,6 +34,10 @@ def reset_class(data):
 DATA_FILE = "class_data.txt"
 LOG_FILE = "audit_log.txt"
 
+store = RosterStore(DATA_FILE)
+roster = CachedRoster(store)
+board = Leaderboard()
+
 def import_from_file(data):
     os.system('clear')
     print("--- IMPORT STUDENTS ---")
@@ -39,28 +48,17 @@ def import_from_file(data):
         input("Press Enter to return...")
         return
 
-    count = 0
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line: continue # Skip empty lines
-                
-                # Handle "Name,Score" or just "Name"
-                if "," in line:
-                    name, score_str = line.rsplit(",", 1)
-                    score = int(score_str)
-                else:
-                    name = line
-                    score = 0
-                
-                # Only add if not already there
-                if name not in data:
-                    data[name] = score
-                    count += 1
-                    print(f"Imported: {name}")
-                else:
-                    print(f"Skipped (Duplicate): {name}")
+        # Handles "Name,Score" or just "Name", duplicates are matched loosely
+        result = import_roster(filename, data)
+        for name, score in result.added.items():
+            data[name] = score
+            board.set(name, score)
+        count = len(result.added)
+
+        print(f"Skipped (Duplicate): {result.duplicates}")
+        for error in result.errors:
+            print(f"Skipped (Bad line): {error}")
         
         if count > 0:
             save_data(data)
@@ -76,25 +74,20 @@ def import_from_file(data):
     
 # --- DATA MANAGEMENT ---
 def load_data():
-    data = {}
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                for line in f:
-                    # Expecting format: "Name,Score"
-                    if "," in line:
-                        name, score = line.strip().rsplit(",", 1)
-                        data[name] = int(score)
-        except Exception as e:
-            print(f"Error loading file: {e}")
-            return {}
-    return data
+    # Only re-parses the file when its mtime/size/inode changed
+    try:
+        return roster.get()
+    except Exception as e:
+        print(f"Error loading file: {e}")
+        return {}
 
 def save_data(data):
-    with open(DATA_FILE, 'w', encoding='utf-8') as f:
-        for name, score in data.items():
-            # Saving format: "Name,Score"
-            f.write(f"{name},{score}\n")
+    # Merges in changes made by other processes, then mirrors them in 'data'
+    merged = store.save(data)
+    if merged != data:
+        data.clear()
+        data.update(merged)
+        board.reset(data)
 
 def log_action(message):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -112,6 +105,7 @@ def add_student(data):
             print(f"Error: {name} already exists.")
         else:
             data[name] = 0
+            board.set(name, 0)
             save_data(data)
             log_action(f"Added student: {name}")
             print(f"Success: {name} added.")
@@ -126,6 +120,17 @@ def view_students(data):
         print(f"{name:<20} | {score:<5}")
     input("\nPress Enter to return...")
 
+def view_rankings(data):
+    os.system('clear')
+    print(f"--- RANKINGS ({len(data)}) ---")
+    print(f"{'#':<4} | {'NAME':<20} | {'SCORE':<5}")
+    print("-" * 36)
+    for rank, name, score in board.ranked():
+        print(f"{rank:<4} | {name:<20} | {score:<5}")
+    if data:
+        print("\nCall on next: " + ", ".join(name for name, _ in board.bottom(3)))
+    input("\nPress Enter to return...")
+
 def pick_student(data):
     os.system('clear')
     if not data:
@@ -155,6 +160,7 @@ def pick_student(data):
     
     if choice == '1':
         data[winner] += 1
+        board.set(winner, data[winner])
         save_data(data)
         log_action(f"Graded {winner}: Correct")
         print("Score updated!")
@@ -165,20 +171,39 @@ def pick_student(data):
     input("\nPress Enter to return...")
 
 def export_data(data):
-    filename = f"ScoreSheet_{datetime.now().strftime('%Y%m%d')}.txt"
-    with open(filename, "w") as f:
-        f.write("--- CLASS SCORES ---\n")
-        for k, v in data.items():
-            f.write(f"{k}: {v}\n")
-    print(f"Exported to {filename}")
-    log_action(f"Exported data to {filename}")
+    as_text = input("Also save a plain-text copy? (y/N): ").strip().lower() == 'y'
+    ranked = as_text and input("Rank by score? (y/N): ").strip().lower() == 'y'
+    archive = ScoreArchive(ARCHIVE_NAME)
+    try:
+        try:
+            # Old loose sheets are a bonus; exporting must not depend on them
+            count, failed = ingest_folder(archive, ".")
+        except Exception as e:
+            count, failed = 0, [("score sheets", str(e))]
+        for source, reason in failed:
+            print(f"Skipped old sheet {source}: {reason}")
+        sheet_id = archive.add(data)
+        print(f"Saved score sheet #{sheet_id} (see: python score_archive.py list)")
+        log_action(f"Archived score sheet #{sheet_id}")
+        if as_text:
+            filename = archive.export_text(sheet_id, ".", ranked)
+            print(f"Exported to {filename}")
+            log_action(f"Exported data to {filename}")
+    finally:
+        archive.close()
     input("Press Enter...")
 
 # --- MAIN MENU ---
+def on_roster_changed(data):
+    board.reset(data)
+    print(f"* Class list changed on disk, reloaded ({len(data)} students)")
+
 def main():
+    roster.subscribe(on_roster_changed)
+    board.reset(load_data())
     while True:
-        data = load_data()
         os.system('clear') 
+        data = load_data()
         print("==============================")
         print(" SYSTEM ADMIN CLASS PICKER V1 ")
         print("==============================")
@@ -186,15 +211,17 @@ def main():
         print("2. Add Student")
         print("3. View Class List")
         print("4. Export Log")
-        print("5. Exit")
+        print("5. View Rankings")
+        print("6. Exit")
         
-        choice = input("\nSelect Option [1-5]: ")
+        choice = input("\nSelect Option [1-6]: ")
         
         if choice == '1': pick_student(data)
         elif choice == '2': add_student(data)
         elif choice == '3': view_students(data)
         elif choice == '4': export_data(data)
-        elif choice == '5': 
+        elif choice == '5': view_rankings(data)
+        elif choice == '6': 
             print("Exiting...")
             break
 
@@ -0,0 +1,58 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Small worker pool for file I/O that must not run on the UI thread.
+#
+# Jobs are submitted with a key (normally the path they touch). Jobs sharing
+# a key run one after another in submission order, jobs with different keys
+# run in parallel. Results and errors are handed to 'dispatch', which for the
+# Kivy app hops back onto the UI thread via Clock.schedule_once.
+
+
+def run_inline(callback):
+    callback()
+
+
+class IOExecutor:
+    def __init__(self, max_workers=2, dispatch=run_inline):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="io")
+        self._dispatch = dispatch
+        self._lock = threading.Lock()
+        self._queues = {}
+
+    def submit(self, key, fn, *args, on_done=None, on_error=None):
+        """Queues fn(*args) behind earlier jobs with the same key"""
+        job = (fn, args, on_done, on_error)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append(job)
+                return
+            self._queues[key] = deque()
+        self._pool.submit(self._run, key, job)
+
+    def _run(self, key, job):
+        while job is not None:
+            fn, args, on_done, on_error = job
+            try:
+                result = fn(*args)
+            except Exception as e:
+                if on_error is not None:
+                    self._dispatch(lambda e=e: on_error(e))
+                else:
+                    print(f"Background job failed: {e}")
+            else:
+                if on_done is not None:
+                    self._dispatch(lambda result=result: on_done(result))
+            with self._lock:
+                queue = self._queues[key]
+                if queue:
+                    job = queue.popleft()
+                else:
+                    del self._queues[key]
+                    job = None
+
+    def shutdown(self):
+        """Waits for queued jobs (e.g. the last save) to finish"""
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,214 @@
+import random
+from itertools import islice
+
+# Ranking index shared by the GUI and the CLIs.
+#
+# Students are kept in a treap (a binary search tree balanced by random node
+# priorities) ordered by (-score, name), and every node knows the size of its
+# subtree. Memory is one node per student whatever the scores are, and the
+# expected costs are:
+#   set(name, score) -> O(log n)
+#   rank(name)       -> O(log n)   (1 + number of students with a higher score)
+#   position(name)   -> O(log n)   (index in top() order)
+#   top(k)           -> O(k + log n)
+#   bottom(k)        -> O(k + t + log n), t = students tied at the cut-off
+#   tied(score)      -> O(t + log n), t = students holding that score
+
+
+class _Node:
+    __slots__ = ("key", "priority", "left", "right", "size")
+
+    def __init__(self, key):
+        self.key = key
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _split(node, key):
+    """(tree of keys < key, tree of keys >= key)"""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(left, right):
+    """Joins two trees where every key in left is below every key in right"""
+    if left is None or right is None:
+        return left or right
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _delete(node, key):
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _delete(node.left, key)
+    else:
+        node.right = _delete(node.right, key)
+    node.size -= 1
+    return node
+
+
+def _build(keys):
+    """Treap from sorted keys in O(n): a Cartesian tree on the priorities"""
+    stack = []
+    for key in keys:
+        node = _Node(key)
+        last = None
+        while stack and stack[-1].priority < node.priority:
+            last = stack.pop()
+            _update(last)
+        node.left = last
+        if stack:
+            stack[-1].right = node
+        stack.append(node)
+    for node in reversed(stack):
+        _update(node)
+    return stack[0] if stack else None
+
+
+def _count_less(node, key):
+    count = 0
+    while node:
+        if node.key < key:
+            count += _size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+
+def _ascending(node, key=None):
+    """Keys >= key (all keys if None) in order"""
+    stack = []
+    while node:
+        if key is None or node.key >= key:
+            stack.append(node)
+            node = node.left
+        else:
+            node = node.right
+    while stack:
+        node = stack.pop()
+        yield node.key
+        node = node.right
+        while node:
+            stack.append(node)
+            node = node.left
+
+
+def _descending(node):
+    stack = []
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.right
+        node = stack.pop()
+        yield node.key
+        node = node.left
+
+
+class Leaderboard:
+    def __init__(self, students=None):
+        self.reset(students or {})
+
+    def reset(self, students):
+        """Rebuilds the index from a {name: score} mapping"""
+        self._scores = dict(students)
+        self._root = _build(sorted((-score, name) for name, score in self._scores.items()))
+
+    def __len__(self):
+        return len(self._scores)
+
+    def __contains__(self, name):
+        return name in self._scores
+
+    def set(self, name, score):
+        """Adds a student or moves them to a new score"""
+        old = self._scores.get(name)
+        if old == score:
+            return
+        if old is not None:
+            self._root = _delete(self._root, (-old, name))
+        self._scores[name] = score
+        key = (-score, name)
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key)), right)
+
+    def remove(self, name):
+        score = self._scores.pop(name, None)
+        if score is not None:
+            self._root = _delete(self._root, (-score, name))
+
+    def clear(self):
+        self.reset({})
+
+    def score(self, name):
+        return self._scores[name]
+
+    def rank(self, name):
+        """Competition rank: students tied on score share a rank"""
+        # (-score,) sorts before every (-score, name)
+        return _count_less(self._root, (-self._scores[name],)) + 1
+
+    def position(self, name):
+        """Index of name in top() order"""
+        return _count_less(self._root, (-self._scores[name], name))
+
+    def tied(self, score):
+        """Names holding score, in name order"""
+        names = []
+        for neg_score, name in _ascending(self._root, (-score,)):
+            if neg_score != -score:
+                break
+            names.append(name)
+        return names
+
+    def top(self, k=None):
+        """Up to k (name, score) pairs, highest score first"""
+        return [(name, -neg_score) for neg_score, name in islice(_ascending(self._root), k)]
+
+    def bottom(self, k=None):
+        """Up to k (name, score) pairs, lowest score first"""
+        rows = []
+        group = []
+        # Walking backwards visits tied names in reverse, so flip each group
+        for neg_score, name in _descending(self._root):
+            if group and group[-1][1] != -neg_score:
+                rows.extend(reversed(group))
+                group = []
+                if k is not None and len(rows) >= k:
+                    break
+            group.append((name, -neg_score))
+        else:
+            rows.extend(reversed(group))
+        return rows[:k]
+
+    def ranked(self):
+        """Every student as (rank, name, score), best first"""
+        rows = []
+        for name, score in self.top():
+            rank = rows[-1][0] if rows and rows[-1][2] == score else len(rows) + 1
+            rows.append((rank, name, score))
+        return rows
@@ -1,4 +1,3 @@
-import json
 import os
 import random
 from datetime import datetime
@@ -13,14 +12,19 @@ from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.textfield import MDTextField
 from kivymd.uix.button import MDRaisedButton, MDIconButton, MDFillRoundFlatIconButton
 from kivymd.uix.label import MDLabel
-from kivymd.uix.list import OneLineAvatarIconListItem, IconRightWidget, IconLeftWidget, MDList
+from kivymd.uix.list import OneLineAvatarIconListItem, OneLineListItem, IconRightWidget, IconLeftWidget, MDList
 from kivymd.uix.scrollview import MDScrollView
 from kivymd.uix.dialog import MDDialog
 from kivymd.uix.toolbar import MDTopAppBar
 from kivymd.toast import toast
 from kivymd.uix.menu import MDDropdownMenu
-# --- NEW IMPORT: FILE MANAGER ---
-from kivymd.uix.filemanager import MDFileManager
+
+from dir_scanner import DirectoryScanner, RecentSources
+from io_executor import IOExecutor
+from leaderboard import Leaderboard
+from roster_import import import_roster
+from score_archive import ARCHIVE_NAME, ScoreArchive, diff_sheets, format_diff, ingest_folder
+from storage import RosterStore, merge_students
 
 # --- PATH CONFIGURATION ---
 def get_storage_path():
@@ -32,8 +36,16 @@ def get_storage_path():
 STORAGE_PATH = get_storage_path()
 DATA_FILE = os.path.join(STORAGE_PATH, "class_data.json")
 LOG_FILE = os.path.join(STORAGE_PATH, "audit_log.txt")
+ARCHIVE_FILE = os.path.join(STORAGE_PATH, ARCHIVE_NAME)
+RECENT_FILE = os.path.join(STORAGE_PATH, "recent_imports.json")
+# Picker adds rows a page at a time, with a "more" row for the rest
+PICKER_PAGE = 200
 # We no longer need IMPORT_FILE constant since we pick it dynamically
 
+def append_log(entry):
+    with open(LOG_FILE, "a", encoding='utf-8') as f:
+        f.write(entry)
+
 class StudentListItem(OneLineAvatarIconListItem):
     """Custom list item with access to update score text"""
     def __init__(self, name, score, delete_callback, **kwargs):
@@ -47,8 +59,11 @@ class StudentListItem(OneLineAvatarIconListItem):
         delete_icon.bind(on_release=lambda x: self.delete_callback(self))
         self.add_widget(delete_icon)
 
-    def update_score_display(self, new_score):
-        self.text = f"{self.student_name} (Points: {new_score})"
+    def update_score_display(self, new_score, rank=None):
+        if rank is None:
+            self.text = f"{self.student_name} (Points: {new_score})"
+        else:
+            self.text = f"#{rank}  {self.student_name} (Points: {new_score})"
 
 class RecitationPicker(MDApp):
     def build(self):
@@ -61,17 +76,34 @@ class RecitationPicker(MDApp):
         
         self.students = {} 
         self.student_widgets = {} 
+        self.board = Leaderboard()
+        self.ranked_view = False
+        # Re-sorting the list is batched to once per frame
+        self.trigger_ranking = Clock.create_trigger(self.refresh_list_order)
+        self.store = RosterStore(DATA_FILE)
+        self.io = IOExecutor(dispatch=lambda callback: Clock.schedule_once(lambda dt: callback()))
+        # Saves wait until the roster has been loaded, and only one runs at a time
+        self.is_saving = True
+        self.save_again = False
+        self.save_snapshot = {}
         self.is_animating = False
         self.grading_dialog = None
+        self.history_dialog = None
         self.menu = None
-
-        # --- SETUP FILE MANAGER ---
-        self.file_manager = MDFileManager(
-            exit_manager=self.exit_manager,
-            select_path=self.select_path,
-            preview=False,
-            ext=['.txt'] # Only allow text files
-        )
+        self.archive = None
+
+        # --- SETUP FILE PICKER ---
+        # Folders are listed in the background and cached, see dir_scanner.py
+        self.scanner = DirectoryScanner(exts=['.txt']) # Only allow text files
+        self.recent = RecentSources(RECENT_FILE)
+        self.recent_items = []
+        self.picker_dialog = None
+        self.picker_path = os.path.expanduser("~") if platform != "android" else "/storage/emulated/0"
+        self.picker_entries = []
+        self.picker_rows = 0
+        self.picker_limit = PICKER_PAGE
+        self.picker_more = None
+        self.picker_token = None
 
         # --- Main Layout ---
         self.screen = MDScreen()
@@ -141,27 +173,131 @@ class RecitationPicker(MDApp):
         self.screen.add_widget(main_layout)
         
         self.load_data()
+        self.io.submit(RECENT_FILE, self.recent.load,
+                       on_done=lambda items: setattr(self, "recent_items", items))
+        self.io.submit(ARCHIVE_FILE, self.open_archive,
+                       on_done=self.on_archive_opened,
+                       on_error=lambda e: print(f"Error opening score archive: {e}"))
         self.log_action("App Started")
         
         return self.screen
 
-    # --- FILE MANAGER LOGIC (NEW) ---
+    # --- FILE PICKER LOGIC ---
 
     def open_file_manager(self):
-        """Opens the file manager starting at the storage path"""
-        # On Android, we might want to start at /storage/emulated/0 to see user files
-        path = os.path.expanduser("~") if platform != "android" else "/storage/emulated/0"
-        self.file_manager.show(path)
+        """Opens the picker right away; the folder listing fills in behind it"""
+        self.picker_label = MDLabel(theme_text_color="Secondary", font_style="Caption",
+                                    size_hint_y=None, height=dp(24))
+        self.picker_list = MDList()
+        scroll = MDScrollView()
+        scroll.add_widget(self.picker_list)
+        content = MDBoxLayout(orientation='vertical', size_hint_y=None, height=dp(400))
+        content.add_widget(self.picker_label)
+        content.add_widget(scroll)
+
+        self.picker_dialog = MDDialog(
+            title="Import Class",
+            type="custom",
+            content_cls=content,
+            buttons=[MDRaisedButton(text="CANCEL", on_release=self.exit_manager)]
+        )
+        self.picker_dialog.open()
+        self.show_directory(self.picker_path)
+
+    def show_directory(self, path):
+        self.picker_path = path
+        self.picker_label.text = path
+        # Results from scans of a folder we already left are ignored
+        token = self.picker_token = object()
+        cached = self.scanner.peek(path)
+        self.show_listing(path, *(cached or ([], [])))
+        # Revalidates the cached listing, or lists the folder batch by batch
+        on_batch = lambda dirs, files: Clock.schedule_once(
+            lambda dt: self.on_picker_batch(token, path, cached, dirs, files))
+        # Leaving the folder stops its scan so the next one is not queued behind it
+        cancelled = lambda: not self.is_current(token)
+        self.io.submit("scan", self.scanner.scan, path, on_batch, cancelled,
+                       on_done=lambda result: self.on_directory_scanned(token, path, result),
+                       on_error=lambda e: self.on_scan_failed(token))
+
+    def add_picker_row(self, text, icon, on_release):
+        item = OneLineAvatarIconListItem(text=text, on_release=on_release)
+        item.add_widget(IconLeftWidget(icon=icon))
+        self.picker_list.add_widget(item)
+        return item
+
+    def add_picker_entries(self, path, dirs, files):
+        self.picker_entries += [(name, "folder", self.show_directory) for name in dirs]
+        self.picker_entries += [(name, "file-document-outline", self.select_path) for name in files]
+        self.fill_picker(path)
+
+    def fill_picker(self, path):
+        """Shows entries up to picker_limit, then a row to reveal the rest"""
+        if self.picker_more:
+            self.picker_list.remove_widget(self.picker_more)
+            self.picker_more = None
+        end = min(self.picker_limit, len(self.picker_entries))
+        for name, icon, action in self.picker_entries[self.picker_rows:end]:
+            full_path = os.path.join(path, name)
+            self.add_picker_row(name, icon, lambda x, p=full_path, a=action: a(p))
+        self.picker_rows = end
+        hidden = len(self.picker_entries) - end
+        if hidden:
+            self.picker_more = self.add_picker_row(
+                f"{hidden} more...", "dots-horizontal", lambda x: self.show_more_entries(path))
+
+    def show_more_entries(self, path):
+        self.picker_limit += PICKER_PAGE
+        self.fill_picker(path)
+
+    def is_current(self, token):
+        return self.picker_dialog is not None and self.picker_token is token
+
+    def on_picker_batch(self, token, path, cached, dirs, files):
+        # A stale cached listing stays up until the fresh scan completes
+        if self.is_current(token) and not cached:
+            self.add_picker_entries(path, dirs, files)
+
+    def on_directory_scanned(self, token, path, result):
+        if result is None:
+            return # Cancelled, the user moved on
+        dirs, files, changed = result
+        if self.is_current(token) and changed:
+            # Redraw in sorted order (and drop anything that vanished)
+            self.show_listing(path, dirs, files)
+
+    def show_listing(self, path, dirs, files):
+        """Recent shortcuts, then the way up, then the folder's entries"""
+        self.picker_list.clear_widgets()
+        self.picker_entries = []
+        self.picker_rows = 0
+        self.picker_limit = PICKER_PAGE
+        self.picker_more = None
+        for filepath in self.recent_items:
+            self.add_picker_row(f"Recent: {os.path.basename(filepath)}", "history",
+                                lambda x, p=filepath: self.select_path(p))
+        parent = os.path.dirname(path)
+        if parent != path:
+            self.add_picker_row("..", "arrow-up", lambda x: self.show_directory(parent))
+        self.add_picker_entries(path, dirs, files)
+
+    def on_scan_failed(self, token):
+        if self.is_current(token):
+            toast("Cannot open folder")
 
     def select_path(self, path):
         """Called when user selects a file"""
-        self.exit_manager() # Close the manager
+        self.exit_manager() # Close the picker
         toast(f"Selected: {os.path.basename(path)}")
+        self.io.submit(RECENT_FILE, self.recent.add, path,
+                       on_done=lambda items: setattr(self, "recent_items", items))
         self.import_from_file(path) # Pass the path to import logic
 
     def exit_manager(self, *args):
-        """Closes the file manager"""
-        self.file_manager.close()
+        """Closes the file picker"""
+        if self.picker_dialog:
+            self.picker_dialog.dismiss()
+            self.picker_dialog = None
 
     # --- MENU LOGIC ---
 
@@ -177,6 +313,21 @@ class RecitationPicker(MDApp):
                 "text": "Export Scores",
                 "on_release": lambda x="export": self.menu_callback(x),
             },
+            {
+                "viewclass": "OneLineListItem",
+                "text": "Class Order" if self.ranked_view else "Ranked View",
+                "on_release": lambda x="ranking": self.menu_callback(x),
+            },
+            {
+                "viewclass": "OneLineListItem",
+                "text": "Export Ranked",
+                "on_release": lambda x="export_ranked": self.menu_callback(x),
+            },
+            {
+                "viewclass": "OneLineListItem",
+                "text": "Score History",
+                "on_release": lambda x="history": self.menu_callback(x),
+            },
             {
                 "viewclass": "OneLineListItem",
                 "text": "Reset Data",
@@ -198,87 +349,237 @@ class RecitationPicker(MDApp):
             self.open_file_manager() # Trigger the file picker instead of direct import
         elif action == "export":
             self.export_score_sheet()
+        elif action == "export_ranked":
+            self.export_score_sheet(ranked=True)
+        elif action == "history":
+            self.open_score_history()
+        elif action == "ranking":
+            self.ranked_view = not self.ranked_view
+            self.refresh_list_order()
         elif action == "reset":
             self.confirm_clear_all()
 
     # --- LOGGING & FILE IO ---
+    # All file access runs on self.io; callbacks come back on the UI thread.
 
     def log_action(self, message):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         entry = f"[{timestamp}] {message}\n"
-        try:
-            with open(LOG_FILE, "a", encoding='utf-8') as f:
-                f.write(entry)
-        except Exception as e:
-            print(f"Logging failed: {e}")
+        self.io.submit(LOG_FILE, append_log, entry,
+                       on_error=lambda e: print(f"Logging failed: {e}"))
 
-    def export_score_sheet(self):
+    def export_score_sheet(self, ranked=False):
+        """Archives the current scores; ranked exports also get a text file"""
         if not self.students:
             toast("Nothing to export!")
             return
 
-        date_str = datetime.now().strftime("%Y-%m-%d_%H-%M")
-        filename = f"ScoreSheet_{date_str}.txt"
-        filepath = os.path.join(STORAGE_PATH, filename)
+        self.io.submit(ARCHIVE_FILE, self.archive_scores, dict(self.students), ranked,
+                       on_done=self.on_exported,
+                       on_error=self.on_export_failed)
 
-        try:
-            with open(filepath, "w", encoding='utf-8') as f:
-                f.write(f"--- CLASS SCORE SHEET ({date_str}) ---\n\n")
-                for name, score in self.students.items():
-                    f.write(f"{name}: {score}\n")
-            
+    def on_exported(self, result):
+        sheet_id, filename = result
+        if filename:
             toast(f"Saved: {filename}")
             self.log_action(f"Exported scores to {filename}")
+        else:
+            toast(f"Saved score sheet #{sheet_id}")
+            self.log_action(f"Archived score sheet #{sheet_id}")
+
+    def on_export_failed(self, error):
+        toast("Export failed!")
+        self.log_action(f"Export failed: {error}")
+
+    # --- SCORE ARCHIVE ---
+    # These run on the I/O executor, always under the ARCHIVE_FILE key.
+
+    def open_archive(self):
+        self.archive = ScoreArchive(ARCHIVE_FILE)
+        # Older versions wrote loose ScoreSheet_*.txt files, pull them in once.
+        # Exports work even if this fails.
+        try:
+            return ingest_folder(self.archive, STORAGE_PATH)
         except Exception as e:
-            toast("Export failed!")
-            self.log_action(f"Export failed: {e}")
+            return 0, [("score sheet folder", str(e))]
+
+    def on_archive_opened(self, result):
+        count, failed = result
+        if count:
+            self.log_action(f"Imported {count} old score sheets")
+        for source, reason in failed:
+            self.log_action(f"Skipped old score sheet {source}: {reason}")
+
+    def archive_scores(self, students, ranked):
+        sheet_id = self.archive.add(students)
+        filename = None
+        if ranked:
+            filename = os.path.basename(self.archive.export_text(sheet_id, STORAGE_PATH, ranked=True))
+        return sheet_id, filename
+
+    def read_sheet_changes(self, sheet_id, previous_id):
+        sheet = self.archive.get(sheet_id)
+        previous = self.archive.get(previous_id) if previous_id else {}
+        return format_diff(diff_sheets(previous, sheet))
+
+    def write_sheet_text(self, sheet_id):
+        return os.path.basename(self.archive.export_text(sheet_id, STORAGE_PATH))
+
+    # --- SCORE HISTORY DIALOGS ---
+
+    def open_score_history(self):
+        self.io.submit(ARCHIVE_FILE, lambda: self.archive.sheets(),
+                       on_done=self.show_history_dialog,
+                       on_error=lambda e: toast("Score history unavailable"))
+
+    def show_history_dialog(self, sheets):
+        if not sheets:
+            toast("No score sheets yet.")
+            return
+        items = []
+        # Newest 30 first, each compared against the sheet before it
+        for index in range(len(sheets) - 1, max(len(sheets) - 31, -1), -1):
+            sheet_id, taken_at, count = sheets[index]
+            previous_id = sheets[index - 1][0] if index > 0 else None
+            items.append(OneLineListItem(
+                text=f"#{sheet_id}  {taken_at[:16]}  ({count})",
+                on_release=lambda x, s=sheet_id, p=previous_id: self.open_sheet(s, p)))
+        self.history_dialog = MDDialog(title="Score History", type="simple", items=items)
+        self.history_dialog.open()
+
+    def open_sheet(self, sheet_id, previous_id):
+        if self.history_dialog:
+            self.history_dialog.dismiss()
+            self.history_dialog = None
+        self.io.submit(ARCHIVE_FILE, self.read_sheet_changes, sheet_id, previous_id,
+                       on_done=lambda text: self.show_sheet_dialog(sheet_id, previous_id, text),
+                       on_error=lambda e: toast("Could not read score sheet"))
+
+    def show_sheet_dialog(self, sheet_id, previous_id, text):
+        title = f"Sheet #{sheet_id} vs #{previous_id}" if previous_id else f"Sheet #{sheet_id}"
+        dialog = MDDialog(
+            title=title,
+            text=text,
+            buttons=[
+                MDRaisedButton(text="CLOSE", on_release=lambda x: dialog.dismiss()),
+                MDRaisedButton(text="SAVE AS TEXT", on_release=lambda x: self.save_sheet_text(dialog, sheet_id)),
+            ]
+        )
+        dialog.open()
+
+    def save_sheet_text(self, dialog, sheet_id):
+        dialog.dismiss()
+        self.io.submit(ARCHIVE_FILE, self.write_sheet_text, sheet_id,
+                       on_done=self.on_exported_text,
+                       on_error=self.on_export_failed)
+
+    def on_exported_text(self, filename):
+        toast(f"Saved: {filename}")
+        self.log_action(f"Exported scores to {filename}")
 
     def import_from_file(self, filepath):
         """Now accepts a filepath argument"""
-        if not os.path.exists(filepath):
-            toast("File not found!")
-            return
+        self.io.submit(filepath, import_roster, filepath, list(self.students),
+                       on_done=lambda result: self.on_roster_imported(filepath, result),
+                       on_error=self.on_import_failed)
 
-        try:
-            count = 0
-            with open(filepath, "r", encoding='utf-8') as f:
-                lines = f.readlines()
-                for line in lines:
-                    name = line.strip()
-                    if name and name not in self.students:
-                        self.add_student_data(name, 0)
-                        count += 1
-            
-            if count > 0:
-                toast(f"Imported {count} students!")
-                self.log_action(f"Imported {count} names from {os.path.basename(filepath)}")
-                self.save_data()
-            else:
-                toast("No new names found.")
-                
-        except Exception as e:
+    def on_roster_imported(self, filepath, result):
+        count = 0
+        for name, score in result.added.items():
+            if name not in self.students:
+                self.add_student_data(name, score, save=False)
+                count += 1
+        for error in result.errors:
+            self.log_action(f"Import skipped {error}")
+
+        skipped = f" ({result.error_count} bad lines skipped)" if result.error_count else ""
+        if count > 0:
+            toast(f"Imported {count} students!{skipped}")
+            self.log_action(f"Imported {count} names from {os.path.basename(filepath)}")
+            self.save_data()
+        else:
+            toast(f"No new names found.{skipped}")
+
+    def on_import_failed(self, error):
+        if isinstance(error, FileNotFoundError):
+            toast("File not found!")
+        else:
             toast("Import Error")
-            self.log_action(f"Import Error: {e}")
+            self.log_action(f"Import Error: {error}")
 
     # --- DATA MANAGEMENT ---
 
     def save_data(self):
-        try:
-            with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.students, f)
-        except Exception as e:
-            print(f"Error saving data: {e}")
+        if self.is_saving:
+            # Picked up again once the running save (or initial load) finishes
+            self.save_again = True
+            return
+        self.is_saving = True
+        snapshot = self.save_snapshot = dict(self.students)
+        self.io.submit(DATA_FILE, self.store.save, snapshot,
+                       on_done=lambda merged: self.on_data_saved(snapshot, merged),
+                       on_error=self.on_save_failed)
+
+    def on_data_saved(self, snapshot, merged):
+        # Keep edits made while the save was running, on top of what was written
+        data = merge_students(snapshot, self.students, merged)
+        if data != self.students:
+            # Another process (e.g. a CLI) changed the roster meanwhile
+            self.sync_students(data)
+        self.finish_save()
+
+    def on_save_failed(self, error):
+        print(f"Error saving data: {error}")
+        self.finish_save()
+
+    def finish_save(self):
+        self.is_saving = False
+        if self.save_again:
+            self.save_again = False
+            self.save_data()
 
     def load_data(self):
-        if os.path.exists(DATA_FILE):
+        self.io.submit(DATA_FILE, self.store.load,
+                       on_done=self.on_data_loaded, on_error=self.on_load_failed)
+
+    def on_data_loaded(self, data):
+        # Students added before the file finished loading are kept
+        self.sync_students(merge_students({}, self.students, data))
+        self.finish_save()
+
+    def on_load_failed(self, error):
+        print(f"Error loading data: {error}")
+        self.finish_save()
+
+    def sync_students(self, data):
+        """Brings the list in line with data merged from disk"""
+        for name in list(self.students):
+            if name not in data:
+                self.list_container.remove_widget(self.student_widgets.pop(name))
+                del self.students[name]
+                self.board.remove(name)
+        for name, score in data.items():
+            if name not in self.students:
+                self.add_student_data(name, score, save=False)
+            elif self.students[name] != score:
+                self.students[name] = score
+                self.board.set(name, score)
+                self.student_widgets[name].update_score_display(score)
+        self.update_count()
+        if self.ranked_view:
+            self.trigger_ranking()
+
+    def on_stop(self):
+        self.io.shutdown()
+        if self.archive:
+            self.archive.close()
+        if self.save_again:
+            # The UI thread never saw the last result, so redo the merge here
             try:
-                with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for name, score in data.items():
-                        self.add_student_data(name, score, save=False)
-                    self.update_count()
+                data = merge_students(self.save_snapshot, self.students, self.store.load())
+                self.store.save(data)
             except Exception as e:
-                print(f"Error loading data: {e}")
+                print(f"Error saving data: {e}")
 
     # --- CORE LOGIC ---
 
@@ -297,10 +598,13 @@ class RecitationPicker(MDApp):
 
     def add_student_data(self, name, score, save=True):
         self.students[name] = score
+        self.board.set(name, score)
         item = StudentListItem(name=name, score=score, delete_callback=self.remove_student)
         self.student_widgets[name] = item
         self.list_container.add_widget(item)
         self.update_count()
+        if self.ranked_view:
+            self.trigger_ranking()
         if save: self.save_data()
 
     def remove_student(self, list_item):
@@ -308,7 +612,10 @@ class RecitationPicker(MDApp):
         if name in self.students:
             del self.students[name]
             del self.student_widgets[name]
+            self.board.remove(name)
             self.list_container.remove_widget(list_item)
+            if self.ranked_view:
+                self.trigger_ranking()
             self.update_count()
             self.save_data()
             self.log_action(f"Removed student: {name}")
@@ -317,6 +624,33 @@ class RecitationPicker(MDApp):
     def update_count(self):
         self.count_label.text = f"Class List ({len(self.students)})"
 
+    def refresh_list_order(self, *args):
+        """Orders the list by rank in ranked view, by insertion otherwise"""
+        if self.ranked_view:
+            rows = self.board.ranked()
+        else:
+            rows = [(None, name, score) for name, score in self.students.items()]
+        self.list_container.clear_widgets()
+        for rank, name, score in rows:
+            item = self.student_widgets[name]
+            item.update_score_display(score, rank)
+            self.list_container.add_widget(item)
+
+    def move_ranked_item(self, name, old_score):
+        """After a one-point grade, moves only that student in ranked view"""
+        item = self.student_widgets[name]
+        container = self.list_container
+        container.remove_widget(item)
+        # children are stored bottom row first
+        container.add_widget(item, index=len(container.children) - self.board.position(name))
+        item.update_score_display(self.students[name], self.board.rank(name))
+        # Everyone still on the old score now has one more student above them
+        tied = self.board.tied(old_score)
+        if tied:
+            rank = self.board.rank(tied[0])
+            for other in tied:
+                self.student_widgets[other].update_score_display(old_score, rank)
+
     # --- ROULETTE & GRADING ---
 
     def start_roulette(self, instance):
@@ -376,9 +710,12 @@ class RecitationPicker(MDApp):
     def grade_student(self, name, correct):
         if correct:
             self.students[name] += 1
-            if name in self.student_widgets:
+            self.board.set(name, self.students[name])
+            if self.ranked_view and name in self.student_widgets:
+                self.move_ranked_item(name, self.students[name] - 1)
+            elif name in self.student_widgets:
                 self.student_widgets[name].update_score_display(self.students[name])
-            toast(f"Point added to {name}!")
+            toast(f"Point added to {name}! Now #{self.board.rank(name)}")
             self.log_action(f"Graded {name}: Correct (+1)")
         else:
             toast(f"No points added for {name}.")
@@ -406,6 +743,7 @@ class RecitationPicker(MDApp):
     def clear_data(self, dialog):
         self.students.clear()
         self.student_widgets.clear()
+        self.board.clear()
         self.list_container.clear_widgets()
         self.update_count()
         self.result_label.text = "Ready?"
@@ -3,31 +3,38 @@ import time
 from datetime import datetime
 import random 
 
+from leaderboard import Leaderboard
+from roster_import import import_roster
+from score_archive import ARCHIVE_NAME, ScoreArchive, ingest_folder
+from storage import CachedRoster, RosterStore
+
 STUDENT_DATA = "student_data.txt"
 APP_LOG = "log.txt"
 
+store = RosterStore(STUDENT_DATA)
+roster = CachedRoster(store)
+board = Leaderboard()
+
 def load_data():
-    # Loads data from file into a dictionary once.
-    data = {}
-    if os.path.exists(STUDENT_DATA):
-        try:
-            with open(STUDENT_DATA, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if "," in line:
-                        name, score = line.strip().rsplit(",", 1)
-                        data[name] = int(score)
-        except Exception as e:
-            print(f"Error loading file: {e}")
-    return data
+    # Returns the cached roster, re-reading the file only if it changed.
+    try:
+        return roster.get()
+    except Exception as e:
+        print(f"Error loading file: {e}")
+        return {}
 
 def save_data(students):
-    # Saves the dictionary back to the text file.
+    # Saves the dictionary back to the text file, merging in changes made
+    # by other processes so the in-memory roster matches what was written.
     try:
-        with open(STUDENT_DATA, 'w', encoding='utf-8') as f:
-            for name, score in students.items():
-                f.write(f"{name},{score}\n")
+        merged = store.save(students)
     except Exception as e:
         print(f"Error saving data: {e}")
+        return
+    if merged != students:
+        students.clear()
+        students.update(merged)
+        board.reset(students)
 
 def log_action(message):
     # Record processes that occured within the system
@@ -47,6 +54,17 @@ def view_scores(students):
         print(f"{name:<20} | {score:<5}")
     input("\nPress Enter to return...")
 
+def view_rankings(students):
+    os.system('clear')
+    print(f"--- CLASS RANKINGS ({len(students)}) ---")
+    print(f"{'RANK':<5} | {'NAME':<20} | {'SCORE':<5}")
+    print("-" * 38)
+    for rank, name, score in board.ranked():
+        print(f"{rank:<5} | {name:<20} | {score:<5}")
+    if students:
+        print("\nNeeds a turn: " + ", ".join(name for name, _ in board.bottom(3)))
+    input("\nPress Enter to return...")
+
 def pick_student(students):
     os.system('clear')
     if not students:
@@ -77,6 +95,7 @@ def pick_student(students):
     
     if choice == '1':
         students[winner] += 1
+        board.set(winner, students[winner])
         save_data(students) # Save immediately!
         print("Score updated!")
         log_action(f"Graded {winner}: Correct")
@@ -95,6 +114,7 @@ def add_student(students):
             print(f"Error: {student_name} is already in the roster.")
         else:
             students[student_name] = 0
+            board.set(student_name, 0)
             save_data(students) # Save immediately!
             log_action(f"Added student: {student_name}")
             print(f"Success: {student_name} has been added.")
@@ -110,21 +130,18 @@ def import_list(students):
         input("\nPress Enter to return...")
         return
     
-    count = 0
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if "," in line:
-                    name, score = line.strip().rsplit(",", 1)
-                    if name not in students:
-                        students[name] = int(score)
-                        count += 1
-                elif line.strip(): # Handle simple list of names
-                    name = line.strip()
-                    if name not in students:
-                        students[name] = 0
-                        count += 1
-        
+        result = import_roster(file_path, students)
+        for name, score in result.added.items():
+            students[name] = score
+            board.set(name, score)
+        count = len(result.added)
+
+        for error in result.errors:
+            print(f"Skipped {error}")
+        if result.error_count > len(result.errors):
+            print(f"... and {result.error_count - len(result.errors)} more bad lines")
+
         if count > 0:
             save_data(students) # Save immediately!
             print(f"\nSuccess! Added {count} new students.")
@@ -136,13 +153,27 @@ def import_list(students):
     input("\nPress Enter to return...")
 
 def export_score_sheet(students):
-    filename = f" ScoreSheet_{datetime.now().strftime('%Y%m%d')}.txt "
-    with open(filename, "w") as f:
-        f.write("--- CLASS SCORES ---\n")
-        for k, v in students.items():
-            f.write(f"{k}: {v}\n")
-    print(f" Exported to {filename} ")
-    log_action(f" Exported data to {filename} ")
+    # Sheets go into the archive; a text copy is only written when asked for
+    as_text = input("Also save a plain-text copy? (y/N): ").strip().lower() == 'y'
+    ranked = as_text and input("Rank by score? (y/N): ").strip().lower() == 'y'
+    archive = ScoreArchive(ARCHIVE_NAME)
+    try:
+        try:
+            # Old loose sheets are a bonus; exporting must not depend on them
+            count, failed = ingest_folder(archive, ".")
+        except Exception as e:
+            count, failed = 0, [("score sheets", str(e))]
+        for source, reason in failed:
+            print(f" Skipped old sheet {source}: {reason} ")
+        sheet_id = archive.add(students)
+        print(f" Saved score sheet #{sheet_id} to {ARCHIVE_NAME} ")
+        log_action(f" Archived score sheet #{sheet_id} ")
+        if as_text:
+            filename = archive.export_text(sheet_id, ".", ranked)
+            print(f" Exported to {filename} ")
+            log_action(f" Exported data to {filename} ")
+    finally:
+        archive.close()
     input("Press Enter...")
 
 def clear_students(students): 
@@ -153,6 +184,7 @@ def clear_students(students):
     
     if opt == 'DELETE':
         students.clear()
+        board.clear()
         save_data(students) # Save immediately!
         log_action("User cleared all student data")
         print("\nSuccess: All student data has been cleared.")
@@ -162,12 +194,18 @@ def clear_students(students):
 
 # --- MAIN MENU ---
 
+def on_roster_changed(students):
+    board.reset(students)
+    print(f"(Roster reloaded: changed by another program, {len(students)} students)")
+
 def main_menu():
-    # Load data once at the start
-    student_data = load_data()
-    
+    roster.subscribe(on_roster_changed)
+    board.reset(load_data())
+
     while True:
         os.system('clear')
+        # Cheap when nothing changed: a stat call, not a re-parse
+        student_data = load_data()
         print("======================================")
         print(" Welcome to Recite - Classroom Picker ")
         print("======================================\n")
@@ -177,7 +215,8 @@ def main_menu():
         print("-- [4] Import Student List")
         print("-- [5] Export Score Sheet")
         print("-- [6] Clear Student List")
-        print("-- [7] Exit")
+        print("-- [7] View Rankings")
+        print("-- [8] Exit")
         
         opt = input("\nSelect an option: ")
 
@@ -195,6 +234,8 @@ def main_menu():
         elif opt == '6':
             clear_students(student_data)
         elif opt == '7':
+            view_rankings(student_data)
+        elif opt == '8':
             print("Exiting...")
             break
         else:
@@ -0,0 +1,136 @@
+import codecs
+import csv
+import unicodedata
+
+# One import engine for the GUI and both CLIs.
+#
+# Accepts a plain list of names or "Name,Score" rows (CSV quoting allowed, an
+# optional "Name,Score" header is skipped). A row whose last field has no
+# digits at all is a name on its own, so unquoted "Last, First" rosters still
+# work. The file is streamed through a large read buffer, so memory stays
+# bounded by the new students found plus a capped list of bad lines. Bad
+# lines are reported, never fatal.
+
+CHUNK_SIZE = 1 << 20
+SNIFF_SIZE = 1 << 16
+MAX_REPORTED_ERRORS = 50
+HEADER_NAMES = {"name", "names", "student", "student name"}
+
+BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def normalize_name(name):
+    """NFC form with runs of whitespace collapsed to single spaces"""
+    return " ".join(unicodedata.normalize("NFC", name).split())
+
+
+def name_key(name):
+    """Dedup key: 'ana  cruz' and 'Ana Cruz' are the same student"""
+    return normalize_name(name).casefold()
+
+
+def detect_encoding(path):
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_SIZE)
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+    try:
+        # final=False tolerates a character cut in half at the sniff boundary
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        # Spreadsheet exports on Windows
+        return "cp1252"
+
+
+class ImportResult:
+    def __init__(self, encoding):
+        self.encoding = encoding
+        self.added = {}
+        self.duplicates = 0
+        self.error_count = 0
+        self.errors = []
+
+    def add_error(self, line_num, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"Line {line_num}: {message}")
+
+
+def parse_row(row):
+    """Returns (name, score, has_score) for a CSV row, None for a blank one.
+
+    Raises ValueError for a row that cannot be imported.
+    """
+    while row and not row[-1].strip():
+        row = row[:-1]
+    if not row:
+        return None
+    if any("\n" in field or "\r" in field for field in row):
+        # A stray quote makes the reader swallow the lines that follow
+        raise ValueError("name runs over several lines (unmatched quote?)")
+    score = None
+    if len(row) > 1:
+        try:
+            score = int(row[-1])
+        except ValueError:
+            if any(char.isdigit() for char in row[-1]):
+                raise ValueError(f"bad score '{row[-1].strip()}'")
+    if score is None:
+        # "Cruz, Ben" is one name, not a bad score
+        return normalize_name(",".join(row)), 0, False
+    # Unquoted "Last, First,3" still works
+    return normalize_name(",".join(row[:-1])), score, True
+
+
+def import_roster(path, existing=()):
+    """Reads new students from path, skipping names already in existing"""
+    encoding = detect_encoding(path)
+    result = ImportResult(encoding)
+    seen = {name_key(name) for name in existing}
+    first_row = True
+
+    with open(path, "r", encoding=encoding, errors="replace", newline="",
+              buffering=CHUNK_SIZE) as f:
+        reader = csv.reader(f)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                break
+            except csv.Error as e:
+                result.add_error(reader.line_num, str(e))
+                continue
+
+            try:
+                parsed = parse_row(row)
+            except ValueError as e:
+                first_row = False
+                result.add_error(reader.line_num, str(e))
+                continue
+            if parsed is None:
+                continue
+            name, score, has_score = parsed
+            is_first, first_row = first_row, False
+            if is_first and not has_score and row[0].strip().casefold() in HEADER_NAMES:
+                continue
+
+            if not name:
+                result.add_error(reader.line_num, "missing name")
+            elif "\ufffd" in name:
+                result.add_error(reader.line_num, "name has unreadable characters")
+            else:
+                key = name_key(name)
+                if key in seen:
+                    result.duplicates += 1
+                else:
+                    seen.add(key)
+                    result.added[name] = score
+    return result
@@ -0,0 +1,286 @@
+import json
+import locale
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime
+
+from leaderboard import Leaderboard
+
+# Every exported score sheet lives in one SQLite file instead of a loose
+# ScoreSheet_<timestamp>.txt. A sheet is stored as the changes since the
+# previous one; every KEYFRAME_EVERY sheets a full copy is stored so reading
+# any sheet replays a short chain. Plain-text sheets are rendered on demand.
+#
+#   python score_archive.py list
+#   python score_archive.py show ID [--ranked]
+#   python score_archive.py diff OLD_ID NEW_ID
+#   python score_archive.py ingest ScoreSheet_*.txt
+
+ARCHIVE_NAME = "score_sheets.db"
+KEYFRAME_EVERY = 20
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+SHEET_DATE_FORMAT = "%Y-%m-%d_%H-%M"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheets (
+    id INTEGER PRIMARY KEY,
+    taken_at TEXT NOT NULL,
+    source TEXT UNIQUE,
+    base_id INTEGER REFERENCES sheets(id),
+    depth INTEGER NOT NULL,
+    students INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sheets_taken_at ON sheets(taken_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def sheet_delta(old, new):
+    """What turns sheet old into sheet new"""
+    changed = [[name, score] for name, score in new.items() if old.get(name) != score]
+    removed = [name for name in old if name not in new]
+    return {"set": changed, "del": removed}
+
+
+def apply_delta(sheet, delta):
+    sheet = dict(sheet)
+    for name in delta["del"]:
+        del sheet[name]
+    for name, score in delta["set"]:
+        sheet[name] = score
+    return sheet
+
+
+def diff_sheets(old, new):
+    """(name, old score, new score) for every student that differs; None = absent"""
+    rows = [(name, old.get(name), score) for name, score in new.items() if old.get(name) != score]
+    rows.extend((name, score, None) for name, score in old.items() if name not in new)
+    return rows
+
+
+def parse_sheet_file(path):
+    """Reads a legacy ScoreSheet_*.txt into (taken_at, {name: score})"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    # Older CLIs wrote sheets in the platform's default encoding
+    for encoding in ("utf-8", locale.getpreferredencoding(False), "cp1252"):
+        try:
+            text = raw.decode(encoding)
+            break
+        except UnicodeDecodeError as e:
+            error = e
+    else:
+        raise error
+    lines = text.splitlines()
+
+    taken_at = datetime.fromtimestamp(os.path.getmtime(path))
+    ranked = False
+    if lines and lines[0].startswith("---"):
+        header = lines.pop(0)
+        ranked = "RANK" in header
+        match = re.search(r"\((\d{4}-\d{2}-\d{2}_\d{2}-\d{2})\)", header)
+        if match:
+            taken_at = datetime.strptime(match.group(1), SHEET_DATE_FORMAT)
+
+    sheet = {}
+    for line in lines:
+        if ": " not in line:
+            continue
+        name, score = line.rsplit(": ", 1)
+        if ranked:
+            name = re.sub(r"^\d+\. ", "", name)
+        sheet[name] = int(score)
+    return taken_at, sheet
+
+
+def render_sheet(taken_at, sheet, ranked=False):
+    date_str = datetime.strptime(taken_at, TIME_FORMAT).strftime(SHEET_DATE_FORMAT)
+    if ranked:
+        lines = [f"--- RANKED SCORE SHEET ({date_str}) ---", ""]
+        lines += [f"{rank}. {name}: {score}" for rank, name, score in Leaderboard(sheet).ranked()]
+    else:
+        lines = [f"--- CLASS SCORE SHEET ({date_str}) ---", ""]
+        lines += [f"{name}: {score}" for name, score in sheet.items()]
+    return "\n".join(lines) + "\n"
+
+
+class ScoreArchive:
+    def __init__(self, path):
+        self.path = path
+        # Callers serialise access (the app runs it on one executor key)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        self._latest = None
+
+    def close(self):
+        self.db.close()
+
+    def add(self, students, taken_at=None, source=None):
+        """Stores a sheet and returns its id"""
+        taken_at = (taken_at or datetime.now()).strftime(TIME_FORMAT)
+        latest = self.latest()
+        if latest is None or latest[1] + 1 >= KEYFRAME_EVERY:
+            base_id, depth = None, 0
+            payload = list(students.items())
+        else:
+            base_id, depth = latest[0], latest[1] + 1
+            payload = sheet_delta(latest[2], students)
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO sheets (taken_at, source, base_id, depth, students, payload)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (taken_at, source, base_id, depth, len(students), json.dumps(payload)))
+        self._latest = (cursor.lastrowid, depth, dict(students))
+        return cursor.lastrowid
+
+    def latest(self):
+        """(id, depth, sheet) of the newest sheet, or None"""
+        if self._latest is None:
+            row = self.db.execute("SELECT id, depth FROM sheets ORDER BY id DESC LIMIT 1").fetchone()
+            if row:
+                self._latest = (row[0], row[1], self.get(row[0]))
+        return self._latest
+
+    def sheets(self):
+        """(id, taken_at, student count) for every sheet, oldest first"""
+        # Ingested legacy sheets can be older than sheets added before them
+        return self.db.execute(
+            "SELECT id, taken_at, students FROM sheets ORDER BY taken_at, id").fetchall()
+
+    def taken_at(self, sheet_id):
+        row = self.db.execute("SELECT taken_at FROM sheets WHERE id = ?", (sheet_id,)).fetchone()
+        if row is None:
+            raise KeyError(sheet_id)
+        return row[0]
+
+    def get(self, sheet_id):
+        """Rebuilds the {name: score} sheet with the given id"""
+        if self._latest is not None and self._latest[0] == sheet_id:
+            return dict(self._latest[2])
+        chain = []
+        while True:
+            row = self.db.execute(
+                "SELECT base_id, payload FROM sheets WHERE id = ?", (sheet_id,)).fetchone()
+            if row is None:
+                raise KeyError(sheet_id)
+            chain.append(json.loads(row[1]))
+            if row[0] is None:
+                break
+            sheet_id = row[0]
+        sheet = dict(chain.pop())
+        while chain:
+            sheet = apply_delta(sheet, chain.pop())
+        return sheet
+
+    def diff(self, old_id, new_id):
+        return diff_sheets(self.get(old_id), self.get(new_id))
+
+    def render(self, sheet_id, ranked=False):
+        return render_sheet(self.taken_at(sheet_id), self.get(sheet_id), ranked)
+
+    def export_text(self, sheet_id, directory, ranked=False):
+        """Writes a plain ScoreSheet_*.txt for the sheet and returns its path"""
+        date_str = datetime.strptime(self.taken_at(sheet_id), TIME_FORMAT).strftime(SHEET_DATE_FORMAT)
+        suffix = "_ranked" if ranked else ""
+        filepath = os.path.join(directory, f"ScoreSheet_{date_str}{suffix}.txt")
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(self.render(sheet_id, ranked))
+        return filepath
+
+    def get_meta(self, key):
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def ingest(self, paths):
+        """Adds legacy sheet files (oldest first), skipping ones seen before.
+
+        Returns (number added, [(file name, reason) for unreadable files]).
+        """
+        known = {row[0] for row in self.db.execute("SELECT source FROM sheets WHERE source IS NOT NULL")}
+        parsed = []
+        failed = []
+        for path in paths:
+            source = os.path.basename(path)
+            if source in known:
+                continue
+            try:
+                taken_at, sheet = parse_sheet_file(path)
+            except (OSError, ValueError) as e:
+                failed.append((source, str(e)))
+                continue
+            parsed.append((taken_at, source, sheet))
+        for taken_at, source, sheet in sorted(parsed, key=lambda item: item[0]):
+            self.add(sheet, taken_at=taken_at, source=source)
+        return len(parsed), failed
+
+
+def ingest_folder(archive, directory):
+    """One-time ingest of the loose ScoreSheet_*.txt files found in directory.
+
+    Later text files are rendered from the archive itself, so they are not
+    picked up again on the next run.
+    """
+    directory = os.path.abspath(directory)
+    key = f"ingested:{directory}"
+    if archive.get_meta(key):
+        return 0, []
+    # The original recite.py wrote " ScoreSheet_<date>.txt " with spaces around it
+    paths = [os.path.join(directory, name) for name in os.listdir(directory)
+             if name.strip().startswith("ScoreSheet_") and name.strip().endswith(".txt")]
+    try:
+        return archive.ingest(paths)
+    finally:
+        # Unreadable files are reported once, not retried on every run
+        archive.set_meta(key, datetime.now().strftime(TIME_FORMAT))
+
+
+def format_diff(rows):
+    lines = []
+    for name, old, new in rows:
+        if old is None:
+            lines.append(f"+ {name}: {new}")
+        elif new is None:
+            lines.append(f"- {name}: {old}")
+        else:
+            lines.append(f"  {name}: {old} -> {new} ({new - old:+d})")
+    return "\n".join(lines) or "No changes."
+
+
+def main(args):
+    archive = ScoreArchive(ARCHIVE_NAME)
+    try:
+        if args[:1] == ["list"]:
+            for sheet_id, taken_at, count in archive.sheets():
+                print(f"#{sheet_id:<4} {taken_at}  ({count} students)")
+        elif args[:1] == ["show"] and len(args) >= 2:
+            print(archive.render(int(args[1]), ranked="--ranked" in args), end="")
+        elif args[:1] == ["diff"] and len(args) == 3:
+            print(format_diff(archive.diff(int(args[1]), int(args[2]))))
+        elif args[:1] == ["ingest"]:
+            count, failed = archive.ingest(args[1:])
+            for source, reason in failed:
+                print(f"Skipped {source}: {reason}")
+            print(f"Ingested {count} score sheets.")
+        else:
+            print("Usage: score_archive.py list | show ID [--ranked] | diff OLD NEW | ingest FILE...")
+            return 1
+    except KeyError as e:
+        print(f"Error: no score sheet #{e}")
+        return 1
+    finally:
+        archive.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,249 @@
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+
+# Shared roster storage for the GUI (main.py) and the CLIs (recite.py, dummy.py).
+#
+# Every data file carries a version number that is bumped on each write.
+# Writers never hold the lock while reading, merging or writing: they
+# remember which file (stat signature and version) they loaded, write the new
+# contents to a temp file, and only take the lock to check that the data file
+# still has that signature and version before an atomic replace. If another
+# process got there first, the temp file is dropped, the per-student changes
+# are replayed on top of the newer file and the save is retried, so no
+# increment is lost.
+
+if os.name == 'nt':
+    import msvcrt
+
+    def _lock(f):
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after ~10 seconds, keep waiting
+                time.sleep(0.05)
+
+    def _unlock(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path):
+    """Advisory exclusive lock on a sidecar '<path>.lock' file"""
+    with open(path + ".lock", "a+") as f:
+        _lock(f)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+def file_signature(st):
+    """What identifies one version of a file on disk (None if missing)"""
+    if st is None:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def stat_signature(path):
+    try:
+        return file_signature(os.stat(path))
+    except OSError:
+        return None
+
+
+def merge_students(base, ours, theirs):
+    """Replays our changes (ours - base) on top of someone else's file (theirs)"""
+    merged = dict(theirs)
+    for name, score in ours.items():
+        if name in base:
+            delta = score - base[name]
+            # A student removed by the other writer stays removed
+            if delta and name in merged:
+                merged[name] += delta
+        else:
+            merged.setdefault(name, score)
+    for name in base:
+        if name not in ours:
+            merged.pop(name, None)
+    return merged
+
+
+# Conflicts normally resolve on the next attempt; this only stops a runaway loop
+MAX_SAVE_ATTEMPTS = 100
+
+
+# --- FILE FORMATS ---
+
+def _parse_json(text):
+    if not text.strip():
+        return {}, 0
+    data = json.loads(text)
+    if set(data) == {"version", "students"} and isinstance(data["students"], dict):
+        return data["students"], data["version"]
+    # Older class_data.json files were a bare {name: score} mapping
+    return data, 0
+
+
+def _dump_json(students, version):
+    # "version" is written first so _peek_json_version only needs the first bytes
+    return json.dumps({"version": version, "students": students})
+
+
+# Both only accept what the parsers treat as a version, so a legacy mapping
+# with a student called "version" (or "# version 2") is never mistaken for one
+JSON_HEADER = re.compile(r'\{"version": (\d+), "students": \{')
+TEXT_HEADER = re.compile(r'# version (\d+)$')
+
+
+def _peek_json_version(head):
+    match = JSON_HEADER.match(head)
+    return int(match.group(1)) if match else 0
+
+
+def _text_header_version(line):
+    """Version from a text file's first line; the header never has a comma"""
+    match = TEXT_HEADER.match(line.rstrip("\r\n"))
+    return int(match.group(1)) if match else None
+
+
+def _peek_text_version(head):
+    version = _text_header_version(head.split("\n", 1)[0])
+    return version if version is not None else 0
+
+
+def _parse_text(text):
+    data = {}
+    version = 0
+    for i, line in enumerate(text.splitlines()):
+        # Header has no comma so older loaders simply skip it
+        header = _text_header_version(line) if i == 0 else None
+        if header is not None:
+            version = header
+        elif "," in line:
+            name, score = line.strip().rsplit(",", 1)
+            data[name] = int(score)
+    return data, version
+
+
+def _dump_text(students, version):
+    lines = [f"# version {version}\n"]
+    for name, score in students.items():
+        # Saving format: "Name,Score"
+        lines.append(f"{name},{score}\n")
+    return "".join(lines)
+
+
+class RosterStore:
+    """Versioned {name: score} file with compare-and-swap saves"""
+
+    def __init__(self, path):
+        self.path = path
+        if path.endswith(".json"):
+            self._parse, self._dump, self._peek = _parse_json, _dump_json, _peek_json_version
+        else:
+            self._parse, self._dump, self._peek = _parse_text, _dump_text, _peek_text_version
+        self.version = 0
+        self.signature = None
+        self._base = {}
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                signature = file_signature(os.fstat(f.fileno()))
+                text = f.read()
+        except FileNotFoundError:
+            return {}, 0, None
+        data, version = self._parse(text)
+        return data, version, signature
+
+    def load(self):
+        """Reads the file and remembers it as the base for the next save"""
+        data, self.version, self.signature = self._read()
+        self._base = dict(data)
+        return data
+
+    def _read_version(self):
+        """Same version _read() would report, from the first bytes only"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                head = f.read(64)
+        except FileNotFoundError:
+            return 0
+        # Legacy files without a header count as version 0
+        return self._peek(head)
+
+    def save(self, students):
+        """Writes students, merging with any newer file. Returns what was written."""
+        data, version, signature = dict(self._base), self.version, self.signature
+        for _ in range(MAX_SAVE_ATTEMPTS):
+            if signature == self.signature:
+                merged = dict(students)
+            else:
+                merged = merge_students(self._base, students, data)
+            tmp_path, tmp_signature = self._write_temp(merged, version + 1)
+            with file_lock(self.path):
+                # Compare-and-swap: same file and same version as we read
+                if stat_signature(self.path) == signature and self._read_version() == version:
+                    os.replace(tmp_path, self.path)
+                    self.signature = tmp_signature
+                    self.version = version + 1
+                    self._base = dict(merged)
+                    return merged
+            # Lost the race: pick up the newer file and try again
+            os.remove(tmp_path)
+            data, version, signature = self._read()
+        raise RuntimeError(f"{self.path} kept changing, gave up saving")
+
+    def _write_temp(self, students, version):
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self._dump(students, version))
+            f.flush()
+            os.fsync(f.fileno())
+            # rename keeps inode, size and mtime, so this is the final signature
+            signature = file_signature(os.fstat(f.fileno()))
+        return tmp_path, signature
+
+
+class CachedRoster:
+    """In-memory roster that is re-read only when the file changes on disk.
+
+    get() costs a single stat() while the file is unchanged. The same dict is
+    updated in place on reload, and subscribers are called with it whenever
+    another process changed the file.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.data = None
+        self._listeners = []
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def get(self):
+        if self.data is None:
+            self.data = self.store.load()
+        elif stat_signature(self.store.path) != self.store.signature:
+            fresh = self.store.load()
+            if fresh != self.data:
+                self.data.clear()
+                self.data.update(fresh)
+                for callback in self._listeners:
+                    callback(self.data)
+        return self.data
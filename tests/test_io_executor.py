@@ -0,0 +1,55 @@
+import threading
+import time
+
+from io_executor import IOExecutor
+
+
+def test_jobs_with_one_key_run_in_submission_order():
+    io = IOExecutor(max_workers=4)
+    order = []
+
+    def job(i):
+        # Early jobs are slower, so only the per-key queue keeps them in order
+        time.sleep(0.002 * (20 - i))
+        order.append(i)
+
+    for i in range(20):
+        io.submit("data.json", job, i)
+    io.shutdown()
+    assert order == list(range(20))
+
+
+def test_jobs_with_different_keys_run_in_parallel():
+    io = IOExecutor(max_workers=2)
+    both_running = threading.Barrier(2, timeout=5)
+    io.submit("a", both_running.wait)
+    io.submit("b", both_running.wait)
+    io.shutdown()
+    assert not both_running.broken
+
+
+def test_results_and_errors_go_through_dispatch():
+    dispatched = []
+    io = IOExecutor(dispatch=lambda callback: dispatched.append(callback))
+    results, errors = [], []
+
+    def fail():
+        raise ValueError("boom")
+
+    io.submit("k", lambda: 42, on_done=results.append)
+    io.submit("k", fail, on_error=errors.append)
+    io.shutdown()
+    assert not results and not errors
+    for callback in dispatched:
+        callback()
+    assert results == [42]
+    assert [str(e) for e in errors] == ["boom"]
+
+
+def test_a_failing_job_does_not_block_its_key():
+    io = IOExecutor()
+    done = []
+    io.submit("k", lambda: 1 / 0, on_error=lambda e: None)
+    io.submit("k", lambda: done.append(True))
+    io.shutdown()
+    assert done == [True]
@@ -0,0 +1,74 @@
+import random
+
+from leaderboard import Leaderboard
+
+
+def brute_force(students):
+    top = sorted(students.items(), key=lambda item: (-item[1], item[0]))
+    bottom = sorted(students.items(), key=lambda item: (item[1], item[0]))
+    ranks = {name: 1 + sum(other > score for other in students.values())
+             for name, score in students.items()}
+    return top, bottom, ranks
+
+
+def test_ties_share_a_competition_rank():
+    board = Leaderboard({"Ana": 3, "Ben": 5, "Cy": 3, "Dee": 1})
+    assert [board.rank(name) for name in ("Ben", "Ana", "Cy", "Dee")] == [1, 2, 2, 4]
+    assert board.ranked() == [(1, "Ben", 5), (2, "Ana", 3), (2, "Cy", 3), (4, "Dee", 1)]
+    assert board.tied(3) == ["Ana", "Cy"]
+    assert board.tied(4) == []
+
+
+def test_top_and_bottom_order_ties_by_name():
+    board = Leaderboard({"Cy": 1, "Ana": 1, "Ben": 2, "Dee": 0})
+    assert board.top(2) == [("Ben", 2), ("Ana", 1)]
+    assert board.bottom(2) == [("Dee", 0), ("Ana", 1)]
+    assert board.bottom(3) == [("Dee", 0), ("Ana", 1), ("Cy", 1)]
+    assert board.bottom() == [("Dee", 0), ("Ana", 1), ("Cy", 1), ("Ben", 2)]
+    assert board.top(0) == [] and board.bottom(0) == []
+
+
+def test_negative_and_large_scores():
+    board = Leaderboard({"Ana": -7, "Ben": 0, "Cy": 5_000_000, "Dee": -10**12})
+    assert board.top() == [("Cy", 5_000_000), ("Ben", 0), ("Ana", -7), ("Dee", -10**12)]
+    assert board.rank("Dee") == 4
+    board.set("Dee", 10**12)
+    assert board.rank("Dee") == 1 and board.rank("Cy") == 2
+    assert board.position("Ana") == 3
+
+
+def test_set_remove_and_clear():
+    board = Leaderboard()
+    board.set("Ana", 1)
+    board.set("Ben", 1)
+    board.set("Ana", 2)
+    assert len(board) == 2 and "Ana" in board
+    assert board.score("Ana") == 2
+    board.remove("Ana")
+    board.remove("Nobody")
+    assert "Ana" not in board and board.top() == [("Ben", 1)]
+    board.clear()
+    assert len(board) == 0 and board.top() == [] and board.ranked() == []
+
+
+def test_matches_brute_force_after_random_updates():
+    rng = random.Random(7)
+    students = {f"s{i}": rng.randint(-3, 3) for i in range(40)}
+    board = Leaderboard(students)
+    for _ in range(300):
+        name = f"s{rng.randint(0, 50)}"
+        if rng.random() < 0.8:
+            students[name] = rng.randint(-3, 3)
+            board.set(name, students[name])
+        else:
+            students.pop(name, None)
+            board.remove(name)
+
+    top, bottom, ranks = brute_force(students)
+    assert board.top() == top
+    for k in (1, 5, len(top)):
+        assert board.top(k) == top[:k]
+        assert board.bottom(k) == bottom[:k]
+    for index, (name, score) in enumerate(top):
+        assert board.rank(name) == ranks[name]
+        assert board.position(name) == index
@@ -0,0 +1,66 @@
+import codecs
+
+import pytest
+
+from roster_import import MAX_REPORTED_ERRORS, detect_encoding, import_roster
+
+
+def write(tmp_path, data, name="roster.csv"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.mark.parametrize("data, encoding", [
+    (codecs.BOM_UTF8 + "José,2\n".encode("utf-8"), "utf-8-sig"),
+    ("José,2\n".encode("utf-16"), "utf-16"),
+    ("José,2\n".encode("utf-8"), "utf-8"),
+    ("José,2\n".encode("cp1252"), "cp1252"),
+])
+def test_encodings_are_detected(tmp_path, data, encoding):
+    path = write(tmp_path, data)
+    assert detect_encoding(path) == encoding
+    result = import_roster(path)
+    assert result.encoding == encoding
+    assert result.added == {"José": 2}
+
+
+def test_header_row_is_skipped(tmp_path):
+    path = write(tmp_path, b"Name,Score\nAna,3\nBen\n")
+    result = import_roster(path)
+    assert result.added == {"Ana": 3, "Ben": 0}
+    assert result.error_count == 0
+
+
+def test_duplicates_are_matched_loosely(tmp_path):
+    path = write(tmp_path, "ana  cruz\nAna Cruz\nBEN\n".encode("utf-8"))
+    result = import_roster(path, existing=["Ben"])
+    assert result.added == {"ana cruz": 0}
+    assert result.duplicates == 2
+
+
+def test_last_first_names_and_quoted_fields(tmp_path):
+    path = write(tmp_path, b'Cruz, Ben\nDoe, Ann,4\n"Lee, Max",2\n')
+    assert import_roster(path).added == {"Cruz, Ben": 0, "Doe, Ann": 4, "Lee, Max": 2}
+
+
+def test_bad_scores_are_reported(tmp_path):
+    path = write(tmp_path, b"Bob,3.5\nDee,12a\nEve,4\n")
+    result = import_roster(path)
+    assert result.added == {"Eve": 4}
+    assert result.errors == ["Line 1: bad score '3.5'", "Line 2: bad score '12a'"]
+
+
+def test_stray_quote_is_reported_not_joined(tmp_path):
+    path = write(tmp_path, b'Ana\n"unterminated\nBob\n')
+    result = import_roster(path)
+    assert result.added == {"Ana": 0}
+    assert result.error_count == 1
+    assert "several lines" in result.errors[0]
+
+
+def test_reported_errors_are_capped(tmp_path):
+    path = write(tmp_path, b",1\n" * (MAX_REPORTED_ERRORS + 10))
+    result = import_roster(path)
+    assert result.error_count == MAX_REPORTED_ERRORS + 10
+    assert len(result.errors) == MAX_REPORTED_ERRORS
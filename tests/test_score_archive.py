@@ -0,0 +1,63 @@
+import os
+import time
+from datetime import datetime
+
+from score_archive import KEYFRAME_EVERY, ScoreArchive, diff_sheets, ingest_folder
+
+
+def test_sheets_rebuild_across_the_delta_chain(tmp_path):
+    archive = ScoreArchive(str(tmp_path / "sheets.db"))
+    expected = {}
+    sheet = {"Ana": 0, "Ben": 0}
+    for i in range(2 * KEYFRAME_EVERY + 3):
+        sheet = dict(sheet)
+        sheet["Ana"] += 1
+        if i % 5 == 0:
+            sheet[f"New{i}"] = i
+        if i % 7 == 3:
+            sheet.pop("Ben", None)
+        expected[archive.add(sheet)] = sheet
+    archive.close()
+
+    # A fresh connection has no cached latest sheet, so every id replays its chain
+    archive = ScoreArchive(str(tmp_path / "sheets.db"))
+    for sheet_id, sheet in expected.items():
+        assert archive.get(sheet_id) == sheet
+    depths = [row[0] for row in archive.db.execute("SELECT depth FROM sheets ORDER BY id")]
+    assert max(depths) == KEYFRAME_EVERY - 1
+    assert depths.count(0) == 3
+    archive.close()
+
+
+def test_diff_reports_changes_additions_and_removals():
+    rows = diff_sheets({"Ana": 1, "Ben": 2}, {"Ana": 3, "Cy": 0})
+    assert set(rows) == {("Ana", 1, 3), ("Cy", None, 0), ("Ben", 2, None)}
+
+
+def test_backdated_ingest_is_listed_by_date(tmp_path):
+    archive = ScoreArchive(":memory:")
+    newer = archive.add({"Ana": 5}, taken_at=datetime(2025, 6, 1))
+    sheet = tmp_path / " ScoreSheet_20200101.txt "
+    sheet.write_text("--- CLASS SCORES ---\nAna: 2\nBen: 1\n")
+    stamp = time.mktime(datetime(2020, 1, 1).timetuple())
+    os.utime(sheet, (stamp, stamp))
+
+    assert ingest_folder(archive, str(tmp_path)) == (1, [])
+    sheets = archive.sheets()
+    assert [row[0] for row in sheets][-1] == newer
+    older = sheets[0][0]
+    assert archive.get(older) == {"Ana": 2, "Ben": 1}
+    assert archive.get(newer) == {"Ana": 5}
+    # Only once per folder
+    assert ingest_folder(archive, str(tmp_path)) == (0, [])
+
+
+def test_unreadable_sheet_is_skipped(tmp_path):
+    (tmp_path / "ScoreSheet_2025-01-01_10-00.txt").write_text(
+        "--- CLASS SCORE SHEET (2025-01-01_10-00) ---\n\nAna: 1\n")
+    (tmp_path / "ScoreSheet_broken.txt").write_text("Ana: lots\n")
+    archive = ScoreArchive(":memory:")
+    count, failed = ingest_folder(archive, str(tmp_path))
+    assert count == 1
+    assert [source for source, reason in failed] == ["ScoreSheet_broken.txt"]
+    assert archive.sheets()[0][1] == "2025-01-01 10:00:00"
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+import storage
+from storage import CachedRoster, RosterStore, merge_students
+
+
+def test_merge_replays_increments_on_top_of_theirs():
+    base = {"Ana": 1, "Ben": 0}
+    ours = {"Ana": 2, "Ben": 0}
+    theirs = {"Ana": 4, "Ben": 3}
+    assert merge_students(base, ours, theirs) == {"Ana": 5, "Ben": 3}
+
+
+def test_merge_keeps_additions_and_removals_from_both_sides():
+    base = {"Ana": 1, "Ben": 1}
+    ours = {"Ana": 2, "Cy": 0}
+    theirs = {"Ben": 1, "Dee": 5}
+    # Ana was removed by them, Ben by us
+    assert merge_students(base, ours, theirs) == {"Cy": 0, "Dee": 5}
+
+
+@pytest.mark.parametrize("filename", ["data.json", "data.txt"])
+def test_concurrent_saves_lose_no_increment(tmp_path, filename):
+    path = str(tmp_path / filename)
+    RosterStore(path).save({"Ana": 0})
+    first, second = RosterStore(path), RosterStore(path)
+    ours, theirs = first.load(), second.load()
+
+    theirs["Ana"] += 1
+    second.save(theirs)
+    # first still holds the old signature, so its swap fails and it merges
+    ours["Ana"] += 1
+    assert first.save(ours) == {"Ana": 2}
+
+    fresh = RosterStore(path)
+    assert fresh.load() == {"Ana": 2}
+    assert fresh.version == 3
+
+
+def test_save_gives_up_when_the_file_keeps_changing(tmp_path, monkeypatch):
+    path = str(tmp_path / "data.json")
+    store = RosterStore(path)
+    store.load()
+    monkeypatch.setattr(storage, "stat_signature", lambda path: "always different")
+    with pytest.raises(RuntimeError):
+        store.save({"Ana": 1})
+
+
+def test_legacy_json_with_a_version_student(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"version": 3, "Bob": 2}))
+    store = RosterStore(str(path))
+    data = store.load()
+    assert data == {"version": 3, "Bob": 2}
+    assert store.version == 0
+    data["Bob"] += 1
+    store.save(data)
+    assert RosterStore(str(path)).load() == {"version": 3, "Bob": 3}
+
+
+def test_text_student_named_like_the_header(tmp_path):
+    path = str(tmp_path / "data.txt")
+    RosterStore(path).save({"# version 2": 4, "Ana": 1})
+    store = RosterStore(path)
+    assert store.load() == {"# version 2": 4, "Ana": 1}
+    assert store.version == 1
+
+
+def test_legacy_text_file_without_header(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("Ana,3\nBen,0\n")
+    store = RosterStore(str(path))
+    assert store.load() == {"Ana": 3, "Ben": 0}
+    assert store.version == 0
+
+
+def test_cached_roster_notifies_on_outside_change(tmp_path):
+    path = str(tmp_path / "data.json")
+    RosterStore(path).save({"Ana": 0})
+    roster = CachedRoster(RosterStore(path))
+    seen = []
+    roster.subscribe(seen.append)
+    data = roster.get()
+    assert roster.get() is data and not seen
+
+    other = RosterStore(path)
+    other.load()
+    other.save({"Ana": 1})
+    assert roster.get() == {"Ana": 1}
+    assert roster.get() is data
+    assert seen == [{"Ana": 1}]